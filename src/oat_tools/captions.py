@@ -1,18 +1,24 @@
 import re
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from tabulate import tabulate
 
 
+# Literal prefix shared by valid and malformed captions, checked before any regex
+CAPTION_PREFIX = "**Kuva "
+
 # Pattern to match captions in the format: **Kuva #:** Some caption text
-CAPTION_PATTERN = re.compile(r"\*\*Kuva (\d+):\*\* (.+)")
+# The text must end in a non-whitespace character so that trailing whitespace is not captured.
+# Possessive quantifiers keep matching linear by never backtracking into a group.
+# Only the number is ASCII-only; \s stays Unicode-aware so e.g. a trailing NBSP is not captured.
+CAPTION_PATTERN = re.compile(r"\*\*Kuva ([0-9]++):\*\* (\s*+\S++(?:\s++\S++)*+)")
 
 # Pattern to match malformed captions where colon is outside the bolding
-MALFORMED_CAPTION_PATTERN = re.compile(r"\*\*Kuva (\d+)\*\*:")
+MALFORMED_CAPTION_PATTERN = re.compile(r"\*\*Kuva (\d+)\*\*:", re.ASCII)
 
 
-@dataclass
+@dataclass(slots=True)
 class Caption:
     """
     A class that represents a caption in a Markdown file.
@@ -22,12 +28,14 @@ class Caption:
         current_number (int): The current number of the caption.
         text (str): The caption text after the number.
         full_line (str): The full original line.
+        indent (int): The length of the leading whitespace in the full line.
     """
 
     line_number: int
     current_number: int
     text: str
     full_line: str
+    indent: int = 0
 
     def get_renumbered_line(self, new_number: int) -> str:
         """
@@ -36,7 +44,7 @@ class Caption:
         return f"**Kuva {new_number}:** {self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptionIssue:
     """
     A class to record a caption numbering issue.
@@ -56,7 +64,7 @@ class CaptionIssue:
     caption_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MalformedCaption:
     """
     A class to record a malformed caption (colon outside bolding).
@@ -72,6 +80,22 @@ class MalformedCaption:
     full_line: str
 
 
+def _find_caption_start(line: str) -> int:
+    """
+    Find where a caption candidate starts in a line without stripping it.
+
+    Args:
+        line (str): The line to check.
+
+    Returns:
+        int: The index of the caption prefix if it is preceded only by whitespace, -1 otherwise.
+    """
+    start = line.find(CAPTION_PREFIX)
+    if start > 0 and not line[:start].isspace():
+        return -1
+    return start
+
+
 def is_caption_line(line: str) -> bool:
     """
     Check if a line is a caption line in the format **Kuva #:** text.
@@ -82,7 +106,8 @@ def is_caption_line(line: str) -> bool:
     Returns:
         bool: True if the line is a caption line, False otherwise.
     """
-    return CAPTION_PATTERN.match(line.strip()) is not None
+    start = _find_caption_start(line)
+    return start != -1 and CAPTION_PATTERN.match(line, start) is not None
 
 
 def parse_caption(line: str, line_number: int) -> Caption | None:
@@ -96,13 +121,18 @@ def parse_caption(line: str, line_number: int) -> Caption | None:
     Returns:
         Caption | None: A Caption object if the line is a valid caption, None otherwise.
     """
-    match = CAPTION_PATTERN.match(line.strip())
+    start = _find_caption_start(line)
+    if start == -1:
+        return None
+
+    match = CAPTION_PATTERN.match(line, start)
     if match:
         return Caption(
             line_number=line_number,
             current_number=int(match.group(1)),
             text=match.group(2),
             full_line=line,
+            indent=start,
         )
     return None
 
@@ -115,29 +145,78 @@ class CaptionFile:
         file_path (Path): The path to the Markdown file.
         lines (list[str]): All lines in the file.
         captions (list[Caption]): List of captions found in the file.
+        malformed (list[MalformedCaption]): List of malformed captions found in the file.
+        newline (str): The line ending used in the file, preserved when writing fixes.
     """
 
     def __init__(self, file_path: Path, auto_load: bool = True):
         self.file_path = file_path
         self.lines: list[str] = []
+        self.newline = "\n"
         self.captions: list[Caption] = []
+        self.malformed: list[MalformedCaption] = []
+        self._issues: list[CaptionIssue] | None = None
 
         if auto_load:
             self._load_captions()
 
     def _load_captions(self):
         """
-        Load captions from the Markdown file.
+        Load captions and malformed captions from the Markdown file in a single pass.
         """
-        self.captions = []  # Clear existing captions before reloading
-        
-        content = self.file_path.read_text(encoding="utf-8")
-        self.lines = content.splitlines()
+        # Clear existing results before reloading
+        self.captions = []
+        self.malformed = []
+        self.lines = []
+        self.newline = "\n"
+        self._issues = None
+
+        # Stream the file so that the whole content is never held as one string
+        with self.file_path.open("r", encoding="utf-8", newline="") as fh:
+            for line_number, raw_line in enumerate(fh):
+                line = raw_line.rstrip("\r\n")
+                self.lines.append(line)
+
+                if line_number == 0 and raw_line.endswith("\r\n"):
+                    self.newline = "\r\n"
 
-        for line_number, line in enumerate(self.lines):
-            caption = parse_caption(line, line_number)
-            if caption:
-                self.captions.append(caption)
+                self._scan_line(line, line_number)
+
+    def _scan_line(self, line: str, line_number: int):
+        """
+        Record a caption and a malformed caption if the line contains them.
+
+        The two checks are independent, so a line with a valid caption can still
+        report a malformed one. A malformed caption is found anywhere in the line, like
+        the whole-file substitution in fix_malformed_captions does.
+        """
+        # Skip lines that cannot hold either kind of caption before any regex
+        prefix_start = line.find(CAPTION_PREFIX)
+        if prefix_start == -1:
+            return
+
+        start = _find_caption_start(line)
+        match = CAPTION_PATTERN.match(line, start) if start != -1 else None
+        if match:
+            self.captions.append(
+                Caption(
+                    line_number=line_number,
+                    current_number=int(match.group(1)),
+                    text=match.group(2),
+                    full_line=line,
+                    indent=start,
+                )
+            )
+
+        # Searched, not matched, as a malformed caption may follow a valid one
+        if MALFORMED_CAPTION_PATTERN.search(line, prefix_start):
+            self.malformed.append(
+                MalformedCaption(
+                    file_path=self.file_path,
+                    line_number=line_number + 1,  # 1-indexed for display
+                    full_line=line.strip(),
+                )
+            )
 
     def get_caption_issues(self) -> list[CaptionIssue]:
         """
@@ -146,6 +225,9 @@ class CaptionFile:
         Returns:
             list[CaptionIssue]: List of issues where caption numbers don't match expected order.
         """
+        if self._issues is not None:
+            return self._issues
+
         issues = []
         for expected_number, caption in enumerate(self.captions, start=1):
             if caption.current_number != expected_number:
@@ -159,6 +241,8 @@ class CaptionFile:
                         + ("..." if len(caption.text) > 50 else ""),
                     )
                 )
+
+        self._issues = issues
         return issues
 
     def is_in_order(self) -> bool:
@@ -168,7 +252,19 @@ class CaptionFile:
         Returns:
             bool: True if captions are in order, False otherwise.
         """
-        return len(self.get_caption_issues()) == 0
+        return not self._has_issue()
+
+    def _has_issue(self) -> bool:
+        """
+        Check if any caption is out of order, stopping at the first mismatch.
+
+        Returns:
+            bool: True if at least one caption has an unexpected number, False otherwise.
+        """
+        return any(
+            caption.current_number != expected_number
+            for expected_number, caption in enumerate(self.captions, start=1)
+        )
 
     def get_malformed_captions(self) -> list[MalformedCaption]:
         """
@@ -177,17 +273,7 @@ class CaptionFile:
         Returns:
             list[MalformedCaption]: List of malformed captions found in the file.
         """
-        malformed = []
-        for line_number, line in enumerate(self.lines):
-            if MALFORMED_CAPTION_PATTERN.search(line.strip()):
-                malformed.append(
-                    MalformedCaption(
-                        file_path=self.file_path,
-                        line_number=line_number + 1,  # 1-indexed for display
-                        full_line=line.strip(),
-                    )
-                )
-        return malformed
+        return self.malformed
 
     def _get_fixed_content(self) -> str:
         """
@@ -196,25 +282,23 @@ class CaptionFile:
         Returns:
             str: The fixed content with captions renumbered.
         """
-        fixed_lines = self.lines.copy()
-
-        for expected_number, caption in enumerate(self.captions, start=1):
-            if caption.current_number != expected_number:
-                # Preserve leading whitespace from original line
-                leading_whitespace = len(caption.full_line) - len(
-                    caption.full_line.lstrip()
-                )
-                prefix = caption.full_line[:leading_whitespace]
-                fixed_lines[caption.line_number] = (
-                    prefix + caption.get_renumbered_line(expected_number)
-                )
-
-        return "\n".join(fixed_lines)
+        # Only the renumbered lines are rebuilt, preserving their leading whitespace
+        replacements = {
+            caption.line_number: caption.full_line[: caption.indent]
+            + caption.get_renumbered_line(expected_number)
+            for expected_number, caption in enumerate(self.captions, start=1)
+            if caption.current_number != expected_number
+        }
+
+        return self.newline.join(
+            replacements.get(line_number, line)
+            for line_number, line in enumerate(self.lines)
+        )
 
     def fix_malformed_captions(self) -> int:
         """
         Fix malformed captions by moving the colon inside the bolding.
-        
+
         Converts **Kuva #**: text to **Kuva #:** text
 
         Returns:
@@ -225,13 +309,13 @@ class CaptionFile:
             return 0
 
         # Use regex to replace all malformed patterns
-        content = self.file_path.read_text(encoding="utf-8")
+        content = self.file_path.read_text(encoding="utf-8", newline="")
         fixed_content = MALFORMED_CAPTION_PATTERN.sub(r"**Kuva \1:**", content)
-        self.file_path.write_text(fixed_content, encoding="utf-8")
-        
+        self.file_path.write_text(fixed_content, encoding="utf-8", newline="")
+
         # Reload captions after fixing
         self._load_captions()
-        
+
         return len(malformed)
 
     def fix_captions(self) -> int:
@@ -241,13 +325,37 @@ class CaptionFile:
         Returns:
             int: The number of captions that were renumbered.
         """
-        issues = self.get_caption_issues()
-        if not issues:
+        if not self._has_issue():
             return 0
 
+        fixed_count = sum(
+            caption.current_number != expected_number
+            for expected_number, caption in enumerate(self.captions, start=1)
+        )
         fixed_content = self._get_fixed_content()
-        self.file_path.write_text(fixed_content, encoding="utf-8")
-        return len(issues)
+        self.file_path.write_text(fixed_content, encoding="utf-8", newline="")
+
+        # Reload captions after fixing, which also clears the cached issues
+        self._load_captions()
+
+        return fixed_count
+
+
+def load_caption_files(file_paths: list[Path]) -> list[CaptionFile]:
+    """
+    Load captions from multiple files concurrently.
+
+    Reading the files is I/O bound, so a thread pool overlaps the disk latency.
+    The returned list keeps the order of the given paths.
+
+    Args:
+        file_paths (list[Path]): Paths to the Markdown files.
+
+    Returns:
+        list[CaptionFile]: A CaptionFile instance for each path.
+    """
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(CaptionFile, file_paths))
 
 
 def print_caption_status(caption_files: list[CaptionFile]):
@@ -257,6 +365,9 @@ def print_caption_status(caption_files: list[CaptionFile]):
     Args:
         caption_files (list[CaptionFile]): List of CaptionFile instances.
     """
+    # Imported lazily so that commands which never print tables skip the import
+    from tabulate import tabulate
+
     all_issues = []
     all_malformed = []
     files_ok = []
@@ -264,13 +375,13 @@ def print_caption_status(caption_files: list[CaptionFile]):
     for cf in caption_files:
         issues = cf.get_caption_issues()
         malformed = cf.get_malformed_captions()
-        
+
         if issues:
             all_issues.extend(issues)
-        
+
         if malformed:
             all_malformed.extend(malformed)
-        
+
         if not issues and not malformed:
             files_ok.append(cf.file_path)
 
@@ -322,24 +433,24 @@ def print_caption_status(caption_files: list[CaptionFile]):
 def fix_caption_files(caption_files: list[CaptionFile]):
     """
     Fix caption numbering in all files and print the results.
-    
+
     This function first fixes malformed captions (colon outside bolding),
     then renumbers captions sequentially.
 
     Args:
         caption_files (list[CaptionFile]): List of CaptionFile instances.
     """
+    # Fix the files one at a time, since several CaptionFiles may share a path
     for cf in caption_files:
         # First, fix malformed captions
         malformed_count = cf.fix_malformed_captions()
-        
+
         # Then, fix numbering
         fixed_count = cf.fix_captions()
-        
+
         # Report results
         if malformed_count > 0:
             print(f"🔧 {cf.file_path}: Fixed {malformed_count} malformed caption(s)")
-        
+
         if fixed_count > 0:
             print(f"🔧 {cf.file_path}: Fixed {fixed_count} caption(s)")
-
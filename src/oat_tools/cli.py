@@ -3,12 +3,12 @@ import click
 from pathlib import Path
 from oat_tools.wordcounter import print_file_word_counts
 from oat_tools.references import (
-    MarkdownFile,
+    load_markdown_files,
     print_references_table,
     print_orphan_references,
 )
 from oat_tools.captions import (
-    CaptionFile,
+    load_caption_files,
     print_caption_status,
     fix_caption_files,
 )
@@ -40,12 +40,8 @@ def references_check(files):
         files: Markdown files to check for reference issues.
     """
 
-    # Create MarkdownReferenceManager instances for each file
-    markdown_files = []
-    for file in files:
-        file_path = Path(str(file))
-        md = MarkdownFile(file_path)
-        markdown_files.append(md)
+    # Load and scan every file up front, in parallel
+    markdown_files = load_markdown_files([Path(str(f)) for f in files])
 
     # Print the references table
     print_references_table(markdown_files)
@@ -63,9 +59,7 @@ def references_fix(files):
     Args:
         files: Markdown files to fix reference issues in.
     """
-    for file in files:
-        file_path = Path(str(file))
-        md = MarkdownFile(file_path)
+    for md in load_markdown_files([Path(str(f)) for f in files]):
         md.fix_references()
 
 
@@ -103,11 +97,7 @@ def captions_check(files):
     Args:
         files: Markdown files to check for caption issues.
     """
-    caption_files = []
-    for file in files:
-        file_path = Path(str(file))
-        cf = CaptionFile(file_path)
-        caption_files.append(cf)
+    caption_files = load_caption_files([Path(str(f)) for f in files])
 
     print_caption_status(caption_files)
 
@@ -124,10 +114,6 @@ def captions_fix(files):
     Args:
         files: Markdown files to fix caption numbering in.
     """
-    caption_files = []
-    for file in files:
-        file_path = Path(str(file))
-        cf = CaptionFile(file_path)
-        caption_files.append(cf)
+    caption_files = load_caption_files([Path(str(f)) for f in files])
 
     fix_caption_files(caption_files)
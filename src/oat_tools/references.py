@@ -1,61 +1,114 @@
-import math
+import operator
 import re
+import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from tabulate import tabulate
-from collections import defaultdict
+from collections import Counter
+
+
+# Characters of a valid reference ID. Both the reference lines and the citations in
+# the body text use this, so that they always agree on what an ID is.
+REFERENCE_ID_CHARS = r"[\w-]+"
+
+# Pattern to validate the ID part of a reference such as [^id]:
+REFERENCE_ID_PATTERN = re.compile(rf"\A{REFERENCE_ID_CHARS}\Z")
+
+# Pattern to find the lines whose first non-whitespace characters are [^, which are
+# the only lines that can be reference lines
+REFERENCE_LINE_START_PATTERN = re.compile(r"^[^\S\n]*\[\^", re.MULTILINE)
+
+# Pattern to match citations such as [^id] in the body text
+CITATION_PATTERN = re.compile(rf"\[\^({REFERENCE_ID_CHARS})\]")
+
+
+def _parse_reference_id(first_word: str) -> str:
+    """
+    Parse the reference ID from the first word of a reference line, such as [^id]:.
+
+    Args:
+        first_word (str): The first word of the reference line.
+
+    Returns:
+        str: The interned reference ID.
+
+    Raises:
+        ValueError: If the word is not a valid [^id]: marker.
+    """
+    # Slice the ID out of [^id]: and only use regex to validate its characters
+    if first_word.startswith("[^") and first_word.endswith("]:"):
+        reference_id = first_word[2:-2]
+        if REFERENCE_ID_PATTERN.match(reference_id):
+            # Interned so that the same ID shares one string object as a dict key
+            return sys.intern(reference_id)
+
+    raise ValueError(
+        f"Invalid reference ID format: {first_word}. Expected format is [^id]:"
+    )
 
 
 def extract_id(full_reference_line: str) -> str:
     """
     Extract a valid reference ID from the full reference line.
     """
-    words = full_reference_line.split()
+    words = full_reference_line.split(None, 1)
     if not words:
         raise ValueError("The reference line is empty or does not contain a valid ID.")
 
-    first_word = words[0]
-
-    # Use regex to match the Vancouver style reference ID
-    match = re.match(r"^\[\^([\w-]+)\]:", first_word)
-    if match:
-        return match.group(1)
-    else:
-        raise ValueError(
-            f"Invalid reference ID format: {first_word}. Expected format is [^id]:"
-        )
+    return _parse_reference_id(words[0])
 
 
-def is_reference_line(line: str) -> bool:
+def _try_parse_reference(line: str) -> tuple[str, str] | None:
     """
-    Identify if a line in a Markdown file is a Vancouver style reference line.
+    Split a line into its first word and the stripped line if it is a reference line.
+
     Args:
-        line (str): The line to check.
+        line (str): The line to parse.
+
     Returns:
-        bool: True if the line is a reference line, False otherwise.
+        tuple[str, str] | None: The first word, such as [^id]:, and the stripped line,
+            or None if the line is not a reference line.
+
     Raises:
         ValueError: If the line is a reference line but does not contain any text after the ID.
     """
+    # Most lines contain no [^ at all, so reject them before anything else
+    if "[^" not in line:
+        return None
 
-    words = line.split()
-    if not words:
-        return False
+    stripped = line.strip()
+    if not stripped.startswith("[^"):
+        return None
 
+    # Only the first word matters, so split at most once
+    words = stripped.split(None, 1)
     first_word = words[0]
-    rest = words[1:]
+    if not first_word.endswith("]:"):
+        return None
 
-    if len(rest) == 0 and first_word.startswith("[^") and first_word.endswith("]:"):
+    if len(words) == 1:
         raise ValueError(
             f"A line with reference {first_word} does not contain any text after the ID."
         )
 
-    if first_word.startswith("[^") and first_word.endswith("]:"):
-        return True
-    return False
+    return first_word, stripped
 
 
-@dataclass
+def is_reference_line(line: str) -> bool:
+    """
+    Identify if a line in a Markdown file is a Vancouver style reference line.
+    Args:
+        line (str): The line to check.
+    Returns:
+        bool: True if the line is a reference line, False otherwise.
+    Raises:
+        ValueError: If the line is a reference line but does not contain any text after the ID.
+    """
+    return _try_parse_reference(line) is not None
+
+
+@dataclass(slots=True)
 class Reference:
     """
     A class that represents a Vancouver style reference in a Markdown file.
@@ -64,27 +117,30 @@ class Reference:
         full_reference_line (str): The full reference line as it appears in the Markdown file.
         first_appearance_pos (int | None): The character position where the reference first appears.
         number_of_appearances (int): The number of times the reference appears in the file.
+        reference_id (str | None): The ID of the reference. Extracted from the line if not given.
     """
 
     full_reference_line: str
     first_appearance_pos: int | None = None
     number_of_appearances: int = 0
+    reference_id: str | None = None
 
     def __post_init__(self):
-        self.reference_id = extract_id(self.full_reference_line)
+        if self.reference_id is None:
+            self.reference_id = extract_id(self.full_reference_line)
 
     def record_appearance(self, position: int):
-        if self.first_appearance_pos is None:
+        if self.first_appearance_pos is None or position < self.first_appearance_pos:
             self.first_appearance_pos = position
-        elif self.first_appearance_pos > position:
-            self.first_appearance_pos = position
-        else:
-            pass
 
         self.number_of_appearances += 1
 
 
-@dataclass
+# Sort key for references by first appearance, implemented in C
+_first_appearance_key = operator.attrgetter("first_appearance_pos")
+
+
+@dataclass(slots=True)
 class UnusedRefRecord:
     """
     A class to record the appearance of a reference in a Markdown file.
@@ -100,7 +156,7 @@ class UnusedRefRecord:
     number_of_appearances: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OrphanRefRecord:
     """
     A class to represent an orphan reference in a Markdown file.
@@ -115,7 +171,7 @@ class OrphanRefRecord:
     number_of_appearances: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ReferenceCollection:
     """
     A class that represents the Vancouver style references in a given Markdown file.
@@ -126,6 +182,7 @@ class ReferenceCollection:
     Methods:
         add_reference(full_reference_line: str): Add a new reference to the collection.
         get_reference_by_id(reference_id: str): Get a reference by its ID.
+        partition(): Split the references into appearing and unappearing ones.
         get_unappearing_references(): Get references that do not appear in the body text.
         get_ordered_by_pos(only_appearing=False): Get the references ordered by their first appearance position.
 
@@ -134,48 +191,87 @@ class ReferenceCollection:
     """
 
     references: list[Reference] = field(default_factory=list)
+    _by_id: dict[str, Reference] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        # Index references passed in the constructor so lookups stay O(1)
+        self._by_id = {ref.reference_id: ref for ref in self.references}
 
     def add_reference(self, full_reference_line: str):
         """
         Add a new reference to the collection.
         """
-        reference_id = extract_id(full_reference_line)
+        # The ID is parsed once while constructing the Reference
+        self._insert(Reference(full_reference_line))
 
-        # Check if reference already exists by iterating through references
-        for ref in self.references:
-            if ref.reference_id == reference_id:
-                raise ValueError(f"Reference with ID {reference_id} already exists.")
+    def _add_if_reference_line(self, line: str) -> bool:
+        """
+        Add the line as a reference if it is a reference line. Each line is split only
+        once, both to classify it and to parse its ID.
+
+        Returns:
+            bool: True if the line was a reference line and was added.
+        """
+        parsed = _try_parse_reference(line)
+        if parsed is None:
+            return False
 
-        reference = Reference(full_reference_line)
+        first_word, stripped = parsed
+        self._insert(Reference(stripped, reference_id=_parse_reference_id(first_word)))
+        return True
+
+    def _insert(self, reference: Reference):
+        reference_id = reference.reference_id
+        if reference_id in self._by_id:
+            raise ValueError(f"Reference with ID {reference_id} already exists.")
+
+        self._by_id[reference_id] = reference
         self.references.append(reference)
 
     def get_reference_by_id(self, reference_id: str) -> Reference:
         """
         Get a reference by its ID.
         """
+        try:
+            return self._by_id[reference_id]
+        except KeyError:
+            raise ValueError(
+                f"Reference with ID {reference_id} not found. Existing references: {[r.reference_id for r in self.references]}"
+            ) from None
+
+    def partition(self) -> tuple[list[Reference], list[Reference]]:
+        """
+        Split the references into those that appear in the body text and those that
+        do not, in a single pass. Both lists keep the insertion order.
+
+        Returns:
+            tuple[list[Reference], list[Reference]]: The appearing and the unappearing references.
+        """
+        appearing = []
+        unappearing = []
         for ref in self.references:
-            if ref.reference_id == reference_id:
-                return ref
-        raise ValueError(
-            f"Reference with ID {reference_id} not found. Existing references: {[r.reference_id for r in self.references]}"
-        )
+            if ref.first_appearance_pos is None:
+                unappearing.append(ref)
+            else:
+                appearing.append(ref)
+        return appearing, unappearing
 
     def get_unappearing_references(self) -> list[Reference]:
         """
         Get references that do not appear in the body text.
         """
-        return [ref for ref in self.references if ref.number_of_appearances == 0]
+        return self.partition()[1]
 
     def get_ordered_by_pos(self, only_appearing=False) -> list[Reference]:
         """
         Get the references ordered by their first appearance position.
         """
-        references = sorted(
-            self.references, key=lambda ref: ref.first_appearance_pos or math.inf
-        )
+        # Only references that appear need sorting, the rest keep their insertion order
+        appearing, unappearing = self.partition()
+        appearing.sort(key=_first_appearance_key)
         if only_appearing:
-            references = [ref for ref in references if ref.number_of_appearances > 0]
-        return references
+            return appearing
+        return appearing + unappearing
 
 
 class MarkdownFile:
@@ -183,107 +279,184 @@ class MarkdownFile:
     A class to manage Vancouver style references in a Markdown file.
 
     Attributes:
-        file_path (Path): The path to the Markdown file.
+        file_path (Path | None): The path to the Markdown file. None if it was created from a string.
         reference_collection (ReferenceCollection): The collection of references in the file.
         auto_load (bool): Whether to automatically load references from the file upon initialization.
 
     Methods:
+        from_string(content, file_path): Create a MarkdownFile from content in memory.
         _load_references(): Load references from the Markdown file.
 
     """
 
     def __init__(self, file_path: Path, auto_load: bool = True):
-        self.file_path = file_path
+        self.file_path: Path | None = file_path
         self.reference_collection = ReferenceCollection()
 
-        self.body_lines: list[str] = []
+        self._body_text = ""
+        self._has_body = False
+        self._orphan_counts: dict[str, int] | None = None
 
         if auto_load:
             self._load_references()
             self._count_appearances()
 
+    @classmethod
+    def from_string(cls, content: str, file_path: Path | None = None) -> "MarkdownFile":
+        """
+        Create a MarkdownFile from content in memory instead of reading it from disk.
+
+        Args:
+            content (str): The Markdown content.
+            file_path (Path | None): The path used in reports and by fix_references. Without
+                a path the content cannot be written back.
+
+        Returns:
+            MarkdownFile: The MarkdownFile with its references loaded and counted.
+        """
+        # Only from_string may leave the path unset, as nothing is read from it here
+        md_file = cls(file_path, auto_load=False)  # type: ignore[arg-type]
+        md_file._parse_content(content)
+        md_file._count_appearances()
+        return md_file
+
+    @property
+    def body_lines(self) -> list[str]:
+        """
+        The non-reference lines of the file, split from the body text on demand.
+        """
+        if not self._has_body:
+            return []
+        return self._body_text.split("\n")
+
     def _load_references(self):
         """
-        Load references from the Markdown file. Move all non-reference lines to body_lines.
+        Load references from the Markdown file. Everything else becomes the body text.
+
+        Only lines starting with [^ are inspected. The body text is joined from the runs
+        of lines between reference lines, so it is built from a few large slices of the
+        content instead of a list of every line.
         """
+        self._parse_content(self.file_path.read_text(encoding="utf-8"))
 
-        content = self.file_path.read_text(encoding="utf-8")
-        lines = content.splitlines()
-        for line in lines:
-            if is_reference_line(line):
-                self.reference_collection.add_reference(line.strip())
-            else:
-                self.body_lines.append(line)
+    def _parse_content(self, content: str):
+        """
+        Split the content into the references and the body text.
+        """
+        # A trailing newline ends the last line instead of starting a new one
+        end = len(content) - 1 if content.endswith("\n") else len(content)
+
+        body_runs = []
+        run_start = 0
+        for match in REFERENCE_LINE_START_PATTERN.finditer(content, 0, end):
+            line_start = match.start()
+            line_end = content.find("\n", line_start, end)
+            if line_end == -1:
+                line_end = end
+
+            line = content[line_start:line_end]
+            if not self.reference_collection._add_if_reference_line(line):
+                continue
+
+            # Keep the lines before this reference line, without the newline between them
+            if line_start > run_start:
+                body_runs.append(content[run_start : line_start - 1])
+            run_start = line_end + 1
+
+        if run_start < len(content):
+            body_runs.append(content[run_start:end])
+
+        self._body_text = "\n".join(body_runs)
+        self._has_body = bool(body_runs)
 
     def _count_appearances(self):
         """
         Count the appearances of each reference in the body text. The position is the byte offset in the file.
+
+        All citations are found in a single pass over the body text. Citations without
+        a matching reference are counted as orphans at the same time.
         """
         for ref in self.reference_collection.references:
             ref.number_of_appearances = 0
             ref.first_appearance_pos = None
 
-        # Find the position of each reference in the body text
-        body_text = "\n".join(self.body_lines)
-        for ref in self.reference_collection.references:
-            ref_id = ref.reference_id
-            pattern = re.compile(r"\[\^" + re.escape(ref_id) + r"\]")
-            matches = list(pattern.finditer(body_text))
+        # A substring check is much cheaper than the regex for files without citations
+        if "[^" not in self._body_text:
+            self._orphan_counts = Counter()
+            return
 
-            for match in matches:
-                ref.record_appearance(match.start())
+        references_by_id = self.reference_collection._by_id
+        orphan_ids = []
 
-    def get_orphan_references(self) -> list[OrphanRefRecord]:
+        for match in CITATION_PATTERN.finditer(self._body_text):
+            ref_id = match.group(1)
+            ref = references_by_id.get(ref_id)
+            if ref is None:
+                orphan_ids.append(ref_id)
+                continue
+
+            # Matches arrive in ascending order, so the first one is the earliest
+            if ref.first_appearance_pos is None:
+                ref.first_appearance_pos = match.start()
+            ref.number_of_appearances += 1
+
+        # Counter counts the collected IDs in C instead of incrementing one by one
+        self._orphan_counts = Counter(orphan_ids)
+
+    def compute_reference_stats(
+        self,
+    ) -> tuple[list[UnusedRefRecord], list[OrphanRefRecord]]:
         """
-        Count [^refs] in the body text that are not in the reference collection so that we can print them later on using tabulate.
-        It should contain the (unexiasting) reference ID and the number of appearances.
+        Get both the unused and the orphan references from a single citation scan.
+
+        The records are built from the current reference collection on every call, so
+        references added after loading are reported too.
 
         Returns:
-            list[OrphanRefRecord]: A list of OrphanRefRecord objects containing the reference ID and the number of appearances.
+            tuple[list[UnusedRefRecord], list[OrphanRefRecord]]: The unused and the orphan references.
         """
-        body_text = "\n".join(self.body_lines)
-        pattern = re.compile(r"\[\^([\w-]+)\]")
-        matches = list(pattern.finditer(body_text))
-
-        # Let's use sets to track existing references
-        existing_references = {
-            ref.reference_id for ref in self.reference_collection.references
-        }
-
-        orphan_references = defaultdict(int)
-        for match in matches:
-            ref_id = match.group(1)
-            if ref_id not in existing_references:
-                orphan_references[ref_id] += 1
+        # Orphans are counted together with the appearances, so reuse that scan
+        if self._orphan_counts is None:
+            self._count_appearances()
 
-        # Convert to a list of OrphanRefRecord objects
-        orphan_references_list = [
+        references_by_id = self.reference_collection._by_id
+        unused_references = [
+            UnusedRefRecord(
+                file_path=self.file_path,
+                reference_id=ref.reference_id,
+                number_of_appearances=ref.number_of_appearances,
+            )
+            for ref in self.reference_collection.get_unappearing_references()
+        ]
+        orphan_references = [
             OrphanRefRecord(
                 file_path=self.file_path,
                 reference_id=ref_id,
                 number_of_appearances=count,
             )
-            for ref_id, count in orphan_references.items()
+            for ref_id, count in self._orphan_counts.items()
+            # A reference added after counting is no longer an orphan
+            if ref_id not in references_by_id
         ]
-        return orphan_references_list
+
+        return unused_references, orphan_references
+
+    def get_orphan_references(self) -> list[OrphanRefRecord]:
+        """
+        Count [^refs] in the body text that are not in the reference collection so that we can print them later on using tabulate.
+        It should contain the (unexiasting) reference ID and the number of appearances.
+
+        Returns:
+            list[OrphanRefRecord]: A list of OrphanRefRecord objects containing the reference ID and the number of appearances.
+        """
+        return self.compute_reference_stats()[1]
 
     def get_unused_references(self) -> list[UnusedRefRecord]:
         """
         Return the a line we can later on print using tabulate.
         It should contain the reference ID, first appearance position, and number of appearances (0)
         """
-
-        return [
-            UnusedRefRecord(
-                file_path=self.file_path,
-                reference_id=ref.reference_id,
-                number_of_appearances=ref.number_of_appearances,
-            )
-            for ref in self.reference_collection.get_ordered_by_pos(
-                only_appearing=False
-            )
-            if ref.number_of_appearances == 0
-        ]
+        return self.compute_reference_stats()[0]
 
     def _materialize(self, content: str, md_path: Path | None = None):
         """
@@ -293,6 +466,10 @@ class MarkdownFile:
             md_path = self.file_path
 
         md_path = self.file_path
+        if md_path is None:
+            raise ValueError(
+                "Cannot write a MarkdownFile created from a string without a file path."
+            )
         md_path.write_text(content, encoding="utf-8")
 
     def _get_final_content(self) -> str:
@@ -300,20 +477,20 @@ class MarkdownFile:
         Join the body lines and references into a final content string.
         """
 
-        body = "\n".join(self.body_lines)
+        body = self._body_text
         references = self.reference_collection.get_ordered_by_pos(only_appearing=True)
-        reference_lines = [ref.full_reference_line for ref in references]
 
-        if not reference_lines:
+        if not references:
             # If there are no references, just return the body
             return body
 
-        # Delete the trailing newlines to avoid extra empty lines at the end
-        if body.endswith("\n"):
-            body = body.rstrip("\n")
-        # Ensure that the references are separated by exactly two newlines (one empty line)
-        final_content = body + "\n" + "\n" + "\n".join(reference_lines) + "\n"
-        return final_content
+        # Delete the trailing newlines to avoid extra empty lines at the end.
+        # The empty strings around the references give exactly one empty line before
+        # them and a final newline after them, all in a single join.
+        parts = [body.rstrip("\n"), ""]
+        parts.extend(ref.full_reference_line for ref in references)
+        parts.append("")
+        return "\n".join(parts)
 
     def fix_references(self):
         """
@@ -323,6 +500,23 @@ class MarkdownFile:
         self._materialize(self._get_final_content())
 
 
+def load_markdown_files(file_paths: list[Path]) -> list[MarkdownFile]:
+    """
+    Load and scan references from multiple files concurrently.
+
+    All parsing happens when a MarkdownFile is created, so the printers only read
+    cached results afterwards. The returned list keeps the order of the given paths.
+
+    Args:
+        file_paths (list[Path]): Paths to the Markdown files.
+
+    Returns:
+        list[MarkdownFile]: A MarkdownFile instance for each path.
+    """
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(MarkdownFile, file_paths))
+
+
 def print_references_table(reference_managers: list[MarkdownFile]):
     """
     Print a table of references from multiple MarkdownFile instances.
@@ -330,6 +524,9 @@ def print_references_table(reference_managers: list[MarkdownFile]):
     Args:
         reference_managers (list[MarkdownFile]): List of hanled files.
     """
+    # Imported lazily so that using the parser alone skips the import
+    from tabulate import tabulate
+
     appearance_records = []
     for manager in reference_managers:
         ar = manager.get_unused_references()
@@ -350,6 +547,9 @@ def print_orphan_references(reference_managers: list[MarkdownFile]):
     Args:
         reference_managers (list[MarkdownReferenceManager]): List of MarkdownReferenceManager instances.
     """
+    # Imported lazily so that using the parser alone skips the import
+    from tabulate import tabulate
+
     orphan_references = []
     for manager in reference_managers:
         orphan_references.extend(manager.get_orphan_references())
@@ -0,0 +1,14 @@
+import pytest
+from pathlib import Path
+
+
+@pytest.fixture
+def md_writer(tmp_path):
+    """Return a function that writes the given content to a Markdown file in tmp_path."""
+
+    def _write(content: str) -> Path:
+        md_path = tmp_path / "test.md"
+        md_path.write_text(content, encoding="utf-8")
+        return md_path
+
+    return _write
@@ -5,7 +5,9 @@ from oat_tools.captions import (
     CaptionFile,
     CaptionIssue,
     MalformedCaption,
+    fix_caption_files,
     is_caption_line,
+    load_caption_files,
     parse_caption,
 )
 
@@ -61,6 +63,25 @@ class TestParseCaption:
         assert caption is not None
         assert caption.text == "Caption with (special) characters!"
 
+    def test_parse_caption_with_surrounding_whitespace(self):
+        caption = parse_caption("  **Kuva 1:** Indented caption  ", 0)
+        assert caption is not None
+        assert caption.text == "Indented caption"
+        assert caption.indent == 2
+
+    def test_parse_caption_with_trailing_non_breaking_space(self):
+        caption = parse_caption("**Kuva 2:** Kuvateksti\xa0", 0)
+        assert caption is not None
+        assert caption.text == "Kuvateksti"
+
+    def test_parse_caption_with_only_non_breaking_space(self):
+        assert parse_caption("**Kuva 2:** \xa0", 0) is None
+        assert not is_caption_line("**Kuva 2:** \xa0")
+
+    def test_parse_caption_prefix_not_at_line_start(self):
+        caption = parse_caption("See **Kuva 1:** in the text", 0)
+        assert caption is None
+
 
 class TestCaption:
     """Tests for the Caption dataclass."""
@@ -104,14 +125,18 @@ class TestCaptionFile:
 
     def test_captions_in_order(self, tmp_path):
         test_file = tmp_path / "test.md"
-        test_file.write_text("**Kuva 1:** First\n**Kuva 2:** Second\n**Kuva 3:** Third\n")
+        test_file.write_text(
+            "**Kuva 1:** First\n**Kuva 2:** Second\n**Kuva 3:** Third\n"
+        )
 
         cf = CaptionFile(test_file)
         assert cf.is_in_order() is True
 
     def test_captions_out_of_order(self, tmp_path):
         test_file = tmp_path / "test.md"
-        test_file.write_text("**Kuva 2:** First\n**Kuva 1:** Second\n**Kuva 5:** Third\n")
+        test_file.write_text(
+            "**Kuva 2:** First\n**Kuva 1:** Second\n**Kuva 5:** Third\n"
+        )
 
         cf = CaptionFile(test_file)
         assert cf.is_in_order() is False
@@ -183,6 +208,53 @@ class TestCaptionFile:
         assert "## Another section" in content
         assert "More text." in content
 
+    def test_fix_captions_preserves_indent_and_inline_mentions(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text(
+            "  **Kuva 3:** Indented caption\n\nSee **Kuva 7:** in the text.\n\n**Kuva 9:** Second\n"
+        )
+
+        cf = CaptionFile(test_file)
+        assert cf.fix_captions() == 2
+
+        content = test_file.read_text()
+        assert content == (
+            "  **Kuva 1:** Indented caption\n\nSee **Kuva 7:** in the text.\n\n**Kuva 2:** Second"
+        )
+
+    def test_caption_issues_cleared_after_fix(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Kuva 3:** Should be 1\n**Kuva 5:** Should be 2\n")
+
+        cf = CaptionFile(test_file)
+        assert cf.get_caption_issues() is cf.get_caption_issues()
+        assert len(cf.get_caption_issues()) == 2
+
+        cf.fix_captions()
+
+        assert cf.get_caption_issues() == []
+        assert cf.is_in_order() is True
+
+    def test_reload_after_content_change(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Kuva 1:** First\n")
+
+        cf = CaptionFile(test_file)
+        test_file.write_text("**Kuva 1:** First\n**Kuva 3:** Second\n")
+        cf._load_captions()
+
+        assert len(cf.captions) == 2
+        assert cf.is_in_order() is False
+
+    def test_fix_captions_preserves_crlf_line_endings(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_bytes(b"**Kuva 2:** First\r\n\r\n**Kuva 1:** Second\r\n")
+
+        cf = CaptionFile(test_file)
+        assert cf.fix_captions() == 2
+
+        assert test_file.read_bytes() == b"**Kuva 1:** First\r\n\r\n**Kuva 2:** Second"
+
     def test_file_with_no_captions(self, tmp_path):
         test_file = tmp_path / "test.md"
         test_file.write_text("# Just a header\n\nSome text without captions.\n")
@@ -209,9 +281,7 @@ class TestMalformedCaptions:
 
     def test_detect_multiple_malformed_captions(self, tmp_path):
         test_file = tmp_path / "test.md"
-        test_file.write_text(
-            "**Kuva 1**: Some text\n\n**Kuva 2**: More text\n"
-        )
+        test_file.write_text("**Kuva 1**: Some text\n\n**Kuva 2**: More text\n")
 
         cf = CaptionFile(test_file)
         malformed = cf.get_malformed_captions()
@@ -257,6 +327,48 @@ class TestMalformedCaptions:
         # But only 2 valid captions are parsed
         assert len(cf.captions) == 2
 
+    def test_malformed_caption_not_at_line_start(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("- **Kuva 1**: list item\n\nSee **Kuva 2**: inline\n")
+
+        cf = CaptionFile(test_file)
+        malformed = cf.get_malformed_captions()
+
+        assert [mal.line_number for mal in malformed] == [1, 3]
+        assert cf.captions == []
+
+        assert cf.fix_malformed_captions() == 2
+        assert (
+            test_file.read_text()
+            == "- **Kuva 1:** list item\n\nSee **Kuva 2:** inline\n"
+        )
+
+    def test_malformed_caption_after_valid_caption_on_same_line(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Kuva 1:** ok **Kuva 2**: bad\n")
+
+        cf = CaptionFile(test_file)
+        malformed = cf.get_malformed_captions()
+
+        assert len(malformed) == 1
+        assert malformed[0].line_number == 1
+        assert len(cf.captions) == 1
+
+        assert cf.fix_malformed_captions() == 1
+        assert test_file.read_text() == "**Kuva 1:** ok **Kuva 2:** bad\n"
+
+    def test_malformed_cleared_after_fix(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Kuva 1**: Some text\n\n**Kuva 2**: More text\n")
+
+        cf = CaptionFile(test_file)
+        assert len(cf.get_malformed_captions()) == 2
+
+        cf.fix_malformed_captions()
+
+        assert cf.get_malformed_captions() == []
+        assert len(cf.captions) == 2
+
     def test_fix_single_malformed_caption(self, tmp_path):
         test_file = tmp_path / "test.md"
         test_file.write_text("**Kuva 1**: Some text here.\n")
@@ -324,15 +436,15 @@ class TestMalformedCaptions:
         )
 
         cf = CaptionFile(test_file)
-        
+
         # Fix malformed captions first
         malformed_count = cf.fix_malformed_captions()
         assert malformed_count == 2
-        
+
         # Now fix numbering
         numbering_count = cf.fix_captions()
         assert numbering_count == 2
-        
+
         # Verify final result
         content = test_file.read_text()
         assert "**Kuva 1:** First caption" in content
@@ -340,7 +452,7 @@ class TestMalformedCaptions:
 
     def test_fix_mixed_malformed_and_valid_captions_renumbers_from_one(self, tmp_path):
         """Test that fixing a mix of malformed and valid captions renumbers starting from 1.
-        
+
         Regression test for bug where captions were renumbered starting from wrong index
         due to _load_captions appending to existing list instead of clearing it first.
         """
@@ -354,14 +466,14 @@ class TestMalformedCaptions:
         )
 
         cf = CaptionFile(test_file)
-        
+
         # Fix malformed captions first
         malformed_count = cf.fix_malformed_captions()
         assert malformed_count == 1  # Only Kuva 2 is malformed
-        
+
         # Now fix numbering
         numbering_count = cf.fix_captions()
-        
+
         # Verify final result - should start from 1, not 5
         content = test_file.read_text()
         assert "**Kuva 1:** Caption text goes here as a one-liner." in content
@@ -369,6 +481,52 @@ class TestMalformedCaptions:
         assert "**Kuva 3:** A way too long caption text." in content
         assert "**Kuva 4:** Problematic duplicate caption number. Yes." in content
         assert "**Kuva 5:** Another problematic caption." in content
-        
+
         # Make sure old numbers are gone
         assert "**Kuva 42:**" not in content
+
+
+class TestMultipleFiles:
+    """Tests for loading and fixing several files at once."""
+
+    def test_load_caption_files_keeps_order(self, tmp_path):
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"test{i}.md"
+            path.write_text(f"**Kuva {i + 1}:** Caption {i}\n")
+            paths.append(path)
+
+        caption_files = load_caption_files(paths)
+
+        assert [cf.file_path for cf in caption_files] == paths
+        assert [cf.captions[0].current_number for cf in caption_files] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+    def test_fix_caption_files_reports_in_order(self, tmp_path, capsys):
+        first = tmp_path / "first.md"
+        second = tmp_path / "second.md"
+        first.write_text("**Kuva 3:** First\n")
+        second.write_text("**Kuva 1**: Second\n")
+
+        fix_caption_files(load_caption_files([first, second]))
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            f"🔧 {first}: Fixed 1 caption(s)",
+            f"🔧 {second}: Fixed 1 malformed caption(s)",
+        ]
+        assert first.read_text() == "**Kuva 1:** First"
+        assert second.read_text() == "**Kuva 1:** Second\n"
+
+    def test_fix_caption_files_with_same_path_twice(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Kuva 2**: First\n\n**Kuva 5:** Second\n")
+
+        fix_caption_files(load_caption_files([test_file, test_file]))
+
+        assert test_file.read_text() == "**Kuva 1:** First\n\n**Kuva 2:** Second"
@@ -1,147 +1,130 @@
-import tempfile
-from pathlib import Path
+import pytest
 
-from oat_tools.wordcounter import count_words
+from oat_tools.wordcounter import count_words, count_words_in_text
 from textwrap import dedent
 
 
+CONTENT_CODE_BLOCKS = dedent("""
+    This is regular text with five words.
+
+    ```python
+    def hello():
+        print("This code should not be counted")
+        return "neither should this"
+    ```
+
+    And this is more regular text with seven words.
+    """).strip()
+
+CONTENT_MULTIPLE_CODE_BLOCKS = dedent("""
+    Start with three words.
+
+    ```bash
+    echo "first code block"
+    ```
+
+    Middle has two words.
+
+    ```javascript
+    console.log("second code block");
+    ```
+
+    End with two words.
+    """).strip()
+
+CONTENT_FOOTNOTES = dedent("""
+    This text references something [^1] and another thing [^2].
+
+    [^1]: This is a footnote that should not be counted
+    [^2]: Another footnote with several words that should also be ignored
+
+    Regular text continues here with more words.
+    """).strip()
+
+CONTENT_FOOTNOTE_WITHOUT_TEXT = dedent("""
+    Text with a citation [^1].
+
+    [^1]:
+    """).strip()
+
+CONTENT_URLS = dedent("""
+    Check out [this website](https://example.com) for more info.
+    Also visit [site](http://another-site.org) and [this](https://github.com/user/repo).
+    This text has five normal words.
+    """).strip()
+
+CONTENT_MARKDOWN_FORMATTING = dedent("""
+    # Header One
+    ## Header Two
+    ### Header Three
+
+    **Bold text** and *italic text* and `inline code`.
+
+    - List item one
+    - List item two
+    - List item three
+
+    !!! note
+        This is a note block with some words.
+
+    > This is a blockquote with several words.
+    """).strip()
+
+
 class TestCountWords:
-    """Test cases for the count_words function."""
-
-    def test_basic_word_counting(self):
-        """Test basic word counting functionality."""
-        content = "This is a simple test with seven words."
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            assert (
-                result == 8
-            )  # "This", "is", "a", "simple", "test", "with", "seven", "words"
-
-    def test_empty_file(self):
-        """Test counting words in an empty file."""
-        content = ""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            assert result == 0
-
-    def test_whitespace_only(self):
-        """Test counting words in a file with only whitespace."""
-        content = "   \n\t  \n  "
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            assert result == 0
-
-    def test_exclude_code_blocks(self):
-        """Test that code blocks are excluded from word count."""
-        content = dedent("""
-            This is regular text with five words.
-
-            ```python
-            def hello():
-                print("This code should not be counted")
-                return "neither should this"
-            ```
-
-            And this is more regular text with seven words.
-            """).strip()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            # Should count: "This", "is", "regular", "text", "with", "five", "words",
-            # "And", "this", "is", "more", "regular", "text", "with", "seven", "words"
-            assert result == 16
-
-    def test_exclude_multiple_code_blocks(self):
-        """Test that multiple code blocks are excluded."""
-        content = dedent("""
-            Start with three words.
-
-            ```bash
-            echo "first code block"
-            ```
-
-            Middle has two words.
-
-            ```javascript
-            console.log("second code block");
-            ```
-
-            End with two words.
-            """).strip()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            # Should count: "Start", "with", "three", "words", "Middle", "has", "two", "words", "End", "with", "two", "words"
-            assert result == 12
-
-    def test_exclude_footnotes(self):
-        """Test that footnotes are excluded from word count."""
-        content = dedent("""
-            This text references something [^1] and another thing [^2].
-
-            [^1]: This is a footnote that should not be counted
-            [^2]: Another footnote with several words that should also be ignored
-
-            Regular text continues here with more words.
-            """).strip()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            # Should count: "This", "text", "references", "something", "1", "and", "another", "thing", "2",
-            # "Regular", "text", "continues", "here", "with", "more", "words"
-            assert result == 16
-
-    def test_exclude_urls(self):
-        """Test that URLs are excluded from word count."""
-        content = dedent("""
-            Check out [this website](https://example.com) for more info.
-            Also visit [site](http://another-site.org) and [this](https://github.com/user/repo).
-            This text has five normal words.
-            """).strip()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            assert result == 14
-
-    def test_markdown_headers_and_formatting(self):
-        """Test that markdown headers and formatting are counted correctly."""
-        content = dedent("""
-            # Header One
-            ## Header Two
-            ### Header Three
-
-            **Bold text** and *italic text* and `inline code`.
-
-            - List item one
-            - List item two
-            - List item three
-                         
-            !!! note
-                This is a note block with some words.
-
-            > This is a blockquote with several words.
-            """).strip()
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            f.flush()
-            result = count_words(Path(f.name))
-            
-            assert result == 39
+    """Test cases for the count_words and count_words_in_text functions."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(
+                "This is a simple test with seven words.",
+                # "This", "is", "a", "simple", "test", "with", "seven", "words"
+                8,
+                id="basic_word_counting",
+            ),
+            pytest.param("", 0, id="empty_file"),
+            pytest.param("   \n\t  \n  ", 0, id="whitespace_only"),
+            pytest.param(
+                CONTENT_CODE_BLOCKS,
+                # Should count: "This", "is", "regular", "text", "with", "five", "words",
+                # "And", "this", "is", "more", "regular", "text", "with", "seven", "words"
+                16,
+                id="exclude_code_blocks",
+            ),
+            pytest.param(
+                CONTENT_MULTIPLE_CODE_BLOCKS,
+                # Should count: "Start", "with", "three", "words", "Middle", "has", "two", "words", "End", "with", "two", "words"
+                12,
+                id="exclude_multiple_code_blocks",
+            ),
+            pytest.param(
+                CONTENT_FOOTNOTES,
+                # Should count: "This", "text", "references", "something", "1", "and", "another", "thing", "2",
+                # "Regular", "text", "continues", "here", "with", "more", "words"
+                16,
+                id="exclude_footnotes",
+            ),
+            pytest.param(
+                CONTENT_FOOTNOTE_WITHOUT_TEXT,
+                # A footnote line without text is excluded instead of raising.
+                # Should count: "Text", "with", "a", "citation", "1"
+                5,
+                id="exclude_footnote_without_text",
+            ),
+            pytest.param(CONTENT_URLS, 14, id="exclude_urls"),
+            pytest.param(
+                CONTENT_MARKDOWN_FORMATTING, 39, id="markdown_headers_and_formatting"
+            ),
+        ],
+    )
+    def test_count_words_in_text(self, content, expected):
+        """Test that only the words outside code blocks, footnotes and URLs are counted."""
+        assert count_words_in_text(content) == expected
+
+    def test_count_words_from_file(self, md_writer):
+        """Test that count_words reads the file and counts its words."""
+        assert count_words(md_writer(CONTENT_CODE_BLOCKS)) == 16
 
     # def test_existing_test_file(self):
     #     """Test using the existing test data file."""